@@ -1,10 +1,16 @@
+import json
 import os
 import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 import yt_dlp
 import requests
-from urllib.parse import urljoin
 import csv
 
 ### Replace with path to .exe for ffmpeg.exe and ffprobe.exe  ###
@@ -13,6 +19,190 @@ FFPROBE_LOCATION = r"PUT_YOUR_PATH_HERE\ffmpeg\ffprobe.exe"
 standard_ydl_opts = {'quiet': True,
                      'ffmpeg_location': FFMPEG_LOCATION,
                      'ffprobe_location': FFPROBE_LOCATION}
+# Number of rows downloaded concurrently. Downloads are network-bound, so threads are enough.
+DEFAULT_MAX_WORKERS = 4
+
+# Metadata fields persisted to <output_dir>/.meta_cache.json. Format and thumbnail URLs are
+# signed and expire, so the full info dict is only kept in memory for the current run.
+META_CACHE_FILENAME = ".meta_cache.json"
+_CACHED_FIELDS = ('id', 'title', 'upload_date', 'webpage_url')
+# Number of full info dicts kept in memory, least recently used are dropped first
+META_CACHE_SIZE = 4096
+# Record of finished audio downloads in the output folder, used to skip them on re-runs
+MANIFEST_FILENAME = "_downloaded.sqlite"
+
+# Facebook video hrefs, e.g.
+#   /123456/videos/7890
+#   /pagename/videos/7890/
+#   https://www.facebook.com/123456/videos/7890/
+#   https://www.facebook.com/pagename/videos/7890
+_LINK_RE = re.compile(r'(?:https?://(?:www\.)?facebook\.com)?/[^/]+/videos/\d+')
+
+# Characters that are illegal in Windows filenames, stripped by _clean
+_ILLEGAL_FILENAME_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+
+# Shared session so thumbnail requests reuse pooled keep-alive connections to the CDN
+_HTTP = requests.Session()
+_HTTP.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) DownloadSermonAV'})
+
+_print_lock = threading.Lock()
+_meta_lock = threading.Lock()
+_manifest_lock = threading.Lock()
+_output_locks_lock = threading.Lock()
+_OUTPUT_LOCKS: dict[str, threading.Lock] = {}
+_META_CACHE: OrderedDict[str, dict] = OrderedDict()
+_thread_local = threading.local()
+_DISK_META_CACHES: dict[str, dict[str, dict]] = {}
+_DIRTY_META_CACHES: set[str] = set()
+
+
+def _log(message: str) -> None:
+    """Print a message without interleaving output from concurrent downloads."""
+    with _print_lock:
+        print(message)
+
+
+def _count_rows(csv_path: str) -> int:
+    """Count the data rows of a CSV (excluding the header) without keeping them in memory."""
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        return max(sum(1 for _ in csv.reader(csvfile)) - 1, 0)
+
+
+def _run_rows(jobs: Iterable, total: int, process_row, max_workers: int) -> None:
+    """
+    Run process_row(idx, job, total) for every CSV row's job on a thread pool and report the results.
+
+    :param jobs: One job per CSV row, e.g. planned lazily from a csv.DictReader so downloads start right away.
+    :param total: Number of rows, used for progress messages.
+    :param process_row: Callable returning a (idx, video_url, out_path) status tuple.
+    :param max_workers: Maximum number of rows processed at the same time.
+    :return: None
+    """
+    def _report(future) -> None:
+        idx, video_url, out_path = future.result()
+        if video_url is None:
+            return
+        if out_path:
+            _log(f"Row {idx}/{total}: downloaded to {out_path}")
+        else:
+            _log(f"Row {idx}/{total}: failed to download {video_url}")
+
+    # Keep only a few rows in flight so the CSV is never held in memory all at once
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        try:
+            for idx, job in enumerate(jobs, start=1):
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _report(future)
+                pending.add(ex.submit(process_row, idx, job, total))
+            for future in as_completed(pending):
+                _report(future)
+        except BaseException:
+            # On Ctrl-C (or any error) drop the queued rows instead of running them all first
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def _clean(text: str, sep: str = '_') -> str:
+    """Strip characters that are illegal in filenames and replace spaces with sep."""
+    return text.translate(_ILLEGAL_FILENAME_CHARS).replace(' ', sep)
+
+
+def _output_lock(path: str) -> threading.Lock:
+    """Return the lock for an output path, so two rows naming the same file don't download it at once."""
+    with _output_locks_lock:
+        return _OUTPUT_LOCKS.setdefault(os.path.normcase(os.path.abspath(path)), threading.Lock())
+
+
+def _meta_ydl() -> yt_dlp.YoutubeDL:
+    """
+    Return this thread's metadata-only YoutubeDL, created on first use and reused for every URL.
+    YoutubeDL objects are not safe to share between threads, so each download worker gets its own.
+    """
+    ydl = getattr(_thread_local, 'meta_ydl', None)
+    if ydl is None:
+        ydl = _thread_local.meta_ydl = yt_dlp.YoutubeDL(standard_ydl_opts)
+    return ydl
+
+
+def _open_manifest(output_dir: str) -> sqlite3.Connection:
+    """Open (creating if needed) the manifest of finished downloads in output_dir."""
+    conn = sqlite3.connect(os.path.join(output_dir, MANIFEST_FILENAME), check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS done(url TEXT PRIMARY KEY, path TEXT, ts REAL)")
+    return conn
+
+
+def _load_meta_cache(cache_path: str) -> dict[str, dict]:
+    """Return the on-disk metadata cache at cache_path, reading it on first use. Caller holds _meta_lock."""
+    if cache_path not in _DISK_META_CACHES:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                _DISK_META_CACHES[cache_path] = json.load(f)
+        except (OSError, ValueError):
+            _DISK_META_CACHES[cache_path] = {}
+    return _DISK_META_CACHES[cache_path]
+
+
+def _remember_info(video_url: str, info: dict) -> None:
+    """Store info in the in-memory LRU cache, evicting the oldest entries. Caller holds _meta_lock."""
+    _META_CACHE[video_url] = info
+    _META_CACHE.move_to_end(video_url)
+    while len(_META_CACHE) > META_CACHE_SIZE:
+        _META_CACHE.popitem(last=False)
+
+
+def get_info(video_url: str, cache_dir: Optional[str] = None) -> dict:
+    """
+    Get the yt-dlp metadata for a video, extracting it from Facebook at most once.
+    Looks in the in-memory LRU cache, then in <cache_dir>/.meta_cache.json, and only then
+    calls extract_info. New results go to the in-memory cache and are queued for the on-disk
+    cache, which is written by save_meta_cache.
+
+    :param video_url: URL of the Facebook video.
+    :param cache_dir: Directory holding the on-disk cache. If None, only the in-memory cache is used.
+    :return: The info dict. Entries read from disk only contain the fields in _CACHED_FIELDS.
+    """
+    cache_path = os.path.join(cache_dir, META_CACHE_FILENAME) if cache_dir else None
+    with _meta_lock:
+        info = _META_CACHE.get(video_url)
+        if info is not None:
+            _META_CACHE.move_to_end(video_url)
+        elif cache_path:
+            # Not added to the in-memory cache, which only holds complete info dicts
+            info = _load_meta_cache(cache_path).get(video_url)
+    if info is not None:
+        return info
+
+    ydl = _meta_ydl()
+    info = ydl.sanitize_info(ydl.extract_info(video_url, download=False))
+
+    with _meta_lock:
+        _remember_info(video_url, info)
+        if cache_path:
+            _load_meta_cache(cache_path)[video_url] = {k: info[k] for k in _CACHED_FIELDS if k in info}
+            _DIRTY_META_CACHES.add(cache_path)
+    return info
+
+
+def save_meta_cache(cache_dir: str) -> None:
+    """
+    Write <cache_dir>/.meta_cache.json if get_info added entries to it since the last save.
+
+    :param cache_dir: Directory holding the on-disk cache.
+    :return: None
+    """
+    cache_path = os.path.join(cache_dir, META_CACHE_FILENAME)
+    with _meta_lock:
+        if cache_path not in _DIRTY_META_CACHES:
+            return
+        _DIRTY_META_CACHES.discard(cache_path)
+        data = json.dumps(_DISK_META_CACHES[cache_path], indent=1)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(tmp_path, cache_path)
 
 
 def download_facebook_video(video_url: str, base_name: Optional[str] = None,
@@ -40,16 +230,43 @@ def download_facebook_video(video_url: str, base_name: Optional[str] = None,
             'quiet': False,
         }
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with _output_lock(outtmpl), yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(video_url, download=True)
             return ydl.prepare_filename(info)
     except Exception as e:
-        print(f"Error downloading video: {e}")
+        _log(f"Error downloading video: {e}")
+        return None
+
+
+def _plan_video_job(row: dict, church_name: str,
+                    default_speaker: str) -> Optional[tuple[str, str]]:
+    """
+    Work out what download_sermon_videos should fetch for one CSV row.
+
+    :param row: CSV row with 'VideoLink', optional 'Speaker', optional 'Title'
+    :param church_name: Prefix for the filename indicating the church
+    :param default_speaker: Speaker name to use when the 'Speaker' column is empty
+    :return: (video_url, base_name), or None if the row has no VideoLink.
+    """
+    video_url = (row.get('VideoLink') or '').strip()
+    if not video_url:
         return None
 
+    # Determine speaker
+    speaker = (row.get('Speaker') or '').strip() or default_speaker
+    speaker_clean = _clean(speaker)
+
+    # Determine optional title
+    raw_title = (row.get('Title') or '').strip()
+    if raw_title:
+        title_clean = _clean(raw_title)
+        return video_url, f"{church_name}_{speaker_clean}_{title_clean}"
+    return video_url, f"{church_name}_{speaker_clean}"
+
 
 def download_sermon_videos(input_csv_path: str, output_dir: str,
-                           church_name: str, default_speaker: str) -> None:
+                           church_name: str, default_speaker: str,
+                           max_workers: int = DEFAULT_MAX_WORKERS) -> None:
     """
     Reads a CSV of Facebook video links and downloads each video using download_facebook_video.
     Filenames will be prefixed with [church_name]_[speaker_name][_title].
@@ -58,35 +275,18 @@ def download_sermon_videos(input_csv_path: str, output_dir: str,
     :param output_dir: Directory where downloaded videos will be saved
     :param church_name: Prefix for each filename indicating the church
     :param default_speaker: Speaker name to use when the 'Speaker' column is empty
+    :param max_workers: Number of videos to download in parallel
     :return: None
     """
     os.makedirs(output_dir, exist_ok=True)
 
-    with open(input_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        # Validate CSV columns
-        if 'VideoLink' not in (reader.fieldnames or []):
-            raise ValueError("Input CSV must contain a 'VideoLink' column")
-        rows = list(reader)
-        total = len(rows)
-
-    for idx, row in enumerate(rows, start=1):
-        video_url = (row.get('VideoLink') or '').strip()
-        if not video_url:
-            print(f"Row {idx}/{total}: missing VideoLink, skipping")
-            continue
-
-        # Determine speaker
-        speaker = (row.get('Speaker') or '').strip() or default_speaker
-        speaker_clean = re.sub(r'[\\/*?:"<>|]', '', speaker).replace(' ', '_')
-
-        # Determine optional title
-        raw_title = (row.get('Title') or '').strip()
-        if raw_title:
-            title_clean = re.sub(r'[\\/*?:"<>|]', '', raw_title).replace(' ', '_')
-            base_name = f"{church_name}_{speaker_clean}_{title_clean}"
-        else:
-            base_name = f"{church_name}_{speaker_clean}"
+    total = _count_rows(input_csv_path)
+
+    def _process_row(idx: int, job: Optional[tuple[str, str]], total: int) -> tuple:
+        if job is None:
+            _log(f"Row {idx}/{total}: missing VideoLink, skipping")
+            return idx, None, None
+        video_url, base_name = job
 
         # Download video
         try:
@@ -95,12 +295,18 @@ def download_sermon_videos(input_csv_path: str, output_dir: str,
                 base_name=base_name,
                 output_dir=output_dir
             )
-            if out_path:
-                print(f"Row {idx}/{total}: downloaded to {out_path}")
-            else:
-                print(f"Row {idx}/{total}: failed to download {video_url}")
         except Exception as e:
-            print(f"Row {idx}/{total}: error for {video_url} → {e}")
+            _log(f"Row {idx}/{total}: error for {video_url} → {e}")
+            out_path = None
+        return idx, video_url, out_path
+
+    with open(input_csv_path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        # Validate CSV columns
+        if 'VideoLink' not in (reader.fieldnames or []):
+            raise ValueError("Input CSV must contain a 'VideoLink' column")
+        jobs = (_plan_video_job(row, church_name, default_speaker) for row in reader)
+        _run_rows(jobs, total, _process_row, max_workers)
 
 
 def download_video_thumbnail(video_url: str, save_path: str) -> bool:
@@ -109,24 +315,24 @@ def download_video_thumbnail(video_url: str, save_path: str) -> bool:
 
     :param video_url: URL of the Facebook video.
     :param save_path: Full file path (including extension) where the thumbnail will be saved.
+                      Its directory must already exist.
     :return: True if download succeeds, False otherwise.
     """
     try:
-        with yt_dlp.YoutubeDL(standard_ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
+        # No on-disk cache here: saved entries don't keep the (expiring) thumbnail URL
+        info = get_info(video_url)
         thumb_url = info.get('thumbnail')
         if not thumb_url:
             return False
 
-        resp = requests.get(thumb_url, stream=True, timeout=10)
+        resp = _HTTP.get(thumb_url, stream=True, timeout=10)
         resp.raise_for_status()
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        resp.raw.decode_content = True
         with open(save_path, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(resp.raw, f, length=1024 * 1024)
         return True
     except Exception as e:
-        print(e)
+        _log(str(e))
         return False
 
 
@@ -143,17 +349,16 @@ def download_facebook_audio(video_url: str, base_name: Optional[str] = None,
     :param include_original_name: If True, will include the original video title in the filename.
     :param target_ext: What type of audio file to download (e.g. 'm4a', 'mp3').
     :param output_dir: Directory to save the audio file.
-    :param fetch_thumbnail: If True, also download the video thumbnail.
+    :param fetch_thumbnail: If True, also save the video thumbnail as [name].jpg.
     :return: Path to the downloaded audio file or None if failed.
     """
     try:
-        # Extract metadata
-        with yt_dlp.YoutubeDL(standard_ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
+        # Extract metadata (cached per URL)
+        info = get_info(video_url, cache_dir=output_dir)
         upload_date = info.get('upload_date')  # YYYYMMDD
         raw_title = info.get('title', '')
         # Sanitize original title for filesystem
-        original_name = re.sub(r'[\\/*?:"<>|]', '', raw_title).replace(' ', '_')
+        original_name = _clean(raw_title)
 
         # Build filename parts
         parts: list[str] = []
@@ -170,44 +375,96 @@ def download_facebook_audio(video_url: str, base_name: Optional[str] = None,
         filename_base = "_".join(parts)
         filename = f"{filename_base}.{target_ext}"
         output_path = os.path.join(output_dir, filename)
-
-        # Download audio and convert
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': output_path,
-            'quiet': False,
-            'ffmpeg_location': FFMPEG_LOCATION,
-            'ffprobe_location': FFPROBE_LOCATION,
-            'postprocessors': [{
+        # Rows that resolve to the same file (duplicate links, or two videos with the same
+        # date and title) wait for each other; the later one then finds the file and returns.
+        with _output_lock(output_path):
+            # Nothing to do if an earlier run already produced this file. On re-runs the metadata
+            # above comes from .meta_cache.json, so this check needs no network access.
+            if os.path.exists(output_path):
+                _log(f"Already have {output_path}, skipping download")
+                return output_path
+
+            # Download audio and convert. The thumbnail (if requested) is written by yt-dlp during
+            # the same run and converted to [filename_base].jpg next to the audio.
+            postprocessors = [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': target_ext,
                 'preferredquality': '192',
-            }],
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([video_url])
-
-        # optionally fetch thumbnail
-        if fetch_thumbnail:
-            # choose .jpg by default
-            thumb_path = os.path.join(output_dir, f"{filename_base}{'.jpg'}")
-            success = download_video_thumbnail(video_url, thumb_path)
-            if not success:
-                print(f"Warning: failed to download thumbnail for {video_url}")
+            }]
+            if fetch_thumbnail:
+                postprocessors.insert(0, {'key': 'FFmpegThumbnailsConvertor', 'format': 'jpg',
+                                          'when': 'before_dl'})
+            # FFmpegExtractAudio stream-copies AAC into .m4a instead of re-encoding, so for m4a
+            # targets prefer an AAC source when one is offered.
+            audio_format = 'bestaudio[acodec^=mp4a]/bestaudio/best' if target_ext == 'm4a' else 'bestaudio/best'
+            ydl_opts = {
+                'format': audio_format,
+                'outtmpl': {
+                    'default': output_path,
+                    'thumbnail': os.path.join(output_dir, f"{filename_base}.%(ext)s"),
+                },
+                'quiet': False,
+                'ffmpeg_location': FFMPEG_LOCATION,
+                'ffprobe_location': FFPROBE_LOCATION,
+                'writethumbnail': fetch_thumbnail,
+                'postprocessors': postprocessors,
+            }
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if info.get('formats'):
+                    # Reuse the metadata extracted above instead of resolving the page again.
+                    # Like yt-dlp's download_with_info_file, drop the keys from the metadata run's
+                    # format selection (e.g. requested_formats with the video stream) so this
+                    # YoutubeDL selects its own audio format. This also returns a fresh copy.
+                    ydl.process_ie_result(ydl.sanitize_info(info, remove_private_keys=True), download=True)
+                else:
+                    # Info came from the on-disk cache, which doesn't keep the (expiring) format URLs
+                    ydl.download([video_url])
 
         return output_path
 
     except Exception as e:
-        print(f"Error downloading audio: {e}")
+        _log(f"Error downloading audio: {e}")
         return None
 
 
+def _plan_audio_job(row: dict, church_name: str,
+                    default_speaker: Optional[str] = None) -> Optional[tuple[str, str]]:
+    """
+    Work out what download_sermon_audio should fetch for one CSV row.
+
+    :param row: CSV row with 'VideoLink', optional 'Speaker', optional 'Title'
+    :param church_name: Prefix for the filename indicating the church
+    :param default_speaker: Speaker name to use when the 'Speaker' column is empty
+    :return: (video_url, base_name), or None if the row has no VideoLink.
+    """
+    video_url = (row.get('VideoLink') or '').strip()
+    if not video_url:
+        return None
+
+    # Determine speaker
+    speaker = (row.get('Speaker') or '').strip() or default_speaker
+    if speaker:
+        speaker_clean = '_' + _clean(speaker)
+    else:
+        speaker_clean = ''
+
+    # Determine optional title
+    raw_title = (row.get('Title') or '').strip()
+    if raw_title:
+        title_clean = _clean(raw_title, sep='-')
+        return video_url, f"{church_name}{speaker_clean}_{title_clean}"
+    return video_url, f"{church_name}{speaker_clean}"
+
+
 def download_sermon_audio(input_csv_path: str, output_dir: str, church_name: str,
                           default_speaker: Optional[str] = None,
-                          include_original_name=True) -> None:
+                          include_original_name=True,
+                          max_workers: int = DEFAULT_MAX_WORKERS) -> None:
     """
     Will call download_facebook_audio to download audio from a CSV of links.
     Base name for download_facebook_audio is [church_name]_[speaker_name]_[title?].
+    Finished downloads are recorded in <output_dir>/_downloaded.sqlite, and rows whose
+    recorded file still exists are skipped.
 
     :param input_csv_path: Path to CSV file (with header) containing columns 'VideoLink',
                            optional 'Speaker', optional 'Title'
@@ -215,38 +472,25 @@ def download_sermon_audio(input_csv_path: str, output_dir: str, church_name: str
     :param church_name: Prefix for each filename indicating the church
     :param default_speaker: Speaker name to use when the 'Speaker' column is empty
     :param include_original_name: If True, will include the original video title in the filename.
+    :param max_workers: Number of audio files to download in parallel
     :return: None
     """
     os.makedirs(output_dir, exist_ok=True)
     print(f'Opening {input_csv_path}')
-    with open(input_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        if 'VideoLink' not in (reader.fieldnames or []):
-            raise ValueError("Input CSV must contain a 'VideoLink' column")
-        rows = list(reader)
-        total = len(rows)
-
-    for idx, row in enumerate(rows, start=1):
-        video_url = (row.get('VideoLink') or '').strip()
-        if not video_url:
-            print(f"Row {idx}/{total}: missing VideoLink, skipping")
-            continue
-
-        # Determine speaker
-        speaker = (row.get('Speaker') or '').strip() or default_speaker
-        if speaker:
-            speaker_clean = re.sub(r'[\\/*?:"<>|]', '', speaker).replace(' ', '_')
-            speaker_clean = '_' + speaker_clean
-        else:
-            speaker_clean = ''
+    total = _count_rows(input_csv_path)
+    manifest = _open_manifest(output_dir)
 
-        # Determine optional title
-        raw_title = (row.get('Title') or '').strip()
-        if raw_title:
-            title_clean = re.sub(r'[\\/*?:"<>|]', '', raw_title).replace(' ', '-')
-            base_name = f"{church_name}{speaker_clean}_{title_clean}"
-        else:
-            base_name = f"{church_name}{speaker_clean}"
+    def _process_row(idx: int, job: Optional[tuple[str, str]], total: int) -> tuple:
+        if job is None:
+            _log(f"Row {idx}/{total}: missing VideoLink, skipping")
+            return idx, None, None
+        video_url, base_name = job
+
+        with _manifest_lock:
+            done = manifest.execute("SELECT path FROM done WHERE url=?", (video_url,)).fetchone()
+        if done and os.path.exists(done[0]):
+            _log(f"Row {idx}/{total}: already downloaded to {done[0]}, skipping")
+            return idx, None, None
 
         # Download
         try:
@@ -256,12 +500,26 @@ def download_sermon_audio(input_csv_path: str, output_dir: str, church_name: str
                 output_dir=output_dir,
                 include_original_name=include_original_name
             )
-            if out_path:
-                print(f"Row {idx}/{total}: downloaded to {out_path}")
-            else:
-                print(f"Row {idx}/{total}: failed to download {video_url}")
         except Exception as e:
-            print(f"Row {idx}/{total}: error for {video_url} → {e}")
+            _log(f"Row {idx}/{total}: error for {video_url} → {e}")
+            out_path = None
+        if out_path:
+            with _manifest_lock, manifest:
+                manifest.execute("INSERT OR REPLACE INTO done VALUES (?, ?, ?)",
+                                 (video_url, out_path, time.time()))
+        return idx, video_url, out_path
+
+    try:
+        with open(input_csv_path, newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile)
+            # Validate CSV columns
+            if 'VideoLink' not in (reader.fieldnames or []):
+                raise ValueError("Input CSV must contain a 'VideoLink' column")
+            jobs = (_plan_audio_job(row, church_name, default_speaker) for row in reader)
+            _run_rows(jobs, total, _process_row, max_workers)
+    finally:
+        manifest.close()
+        save_meta_cache(output_dir)
 
 
 def extract_video_links(html_path: str, output_csv_path: str) -> None:
@@ -274,28 +532,23 @@ def extract_video_links(html_path: str, output_csv_path: str) -> None:
     :param output_csv_path: Path to the output CSV file to write the links.
     :return: None
     """
+    # Only needed here, so a parser install problem can't break the download functions
+    from selectolax.lexbor import LexborHTMLParser
+
     print(f'Extracting video urls from {html_path}')
     with open(html_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Match hrefs like:
-    #   /123456/videos/7890
-    #   /pagename/videos/7890/
-    #   https://www.facebook.com/123456/videos/7890/
-    #   https://www.facebook.com/pagename/videos/7890
-    pattern = r'href="((?:https?://(?:www\.)?facebook\.com)?/[^"/]+/videos/\d+/?[^"]*)"'
-    raw_links = re.findall(pattern, content)
+    # Parse the page and only look at <a> hrefs, rather than regex-scanning the whole blob
+    # (which is mostly inline scripts and JSON). _LINK_RE then checks each href's shape.
+    tree = LexborHTMLParser(content)
+    hrefs = (a.attributes.get('href') or '' for a in tree.css('a[href*="/videos/"]'))
+    raw_links = [href for href in hrefs if _LINK_RE.match(href)]
 
+    # Normalize trailing slash and make relative links absolute
     base_url = "https://www.facebook.com"
-    full_links = set()
-    for link in raw_links:
-        # normalize trailing slash
-        link = link.rstrip('/')
-        if link.startswith('http'):
-            full = link
-        else:
-            full = urljoin(base_url, link)
-        full_links.add(full)
+    full_links = {(link if link.startswith('http') else base_url + link).rstrip('/')
+                  for link in raw_links}
 
     sorted_links = sorted(full_links)
     print(f'Found {len(sorted_links)} video links.')
@@ -303,13 +556,13 @@ def extract_video_links(html_path: str, output_csv_path: str) -> None:
     with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['VideoLink', 'Speaker', 'Title'])
-        for link in sorted_links:
-            writer.writerow([link, '', ''])
+        writer.writerows((link, '', '') for link in sorted_links)
 
 
 def run_standard(root_dir: str, church_name: str,
                  default_speaker: Optional[str] = None,
-                 regenerate_csv: bool = False) -> None:
+                 regenerate_csv: bool = False,
+                 max_workers: int = DEFAULT_MAX_WORKERS) -> None:
     """
     Execute the full Facebook video‐to‐audio pipeline for a directory of sermons.
 
@@ -344,6 +597,7 @@ def run_standard(root_dir: str, church_name: str,
     :param regenerate_csv: If True, always re‐extract links and overwrite the
                            existing `_sermons.csv`; otherwise skip extraction
                            if the CSV already exists.
+    :param max_workers: Number of sermons to download in parallel.
     :return: None. Side effects write files into `root_dir`.
     """
     sermon_csv = os.path.join(root_dir, "_sermons.csv")
@@ -358,7 +612,8 @@ def run_standard(root_dir: str, church_name: str,
 
     # Step 2: download audio files
     download_sermon_audio(input_csv_path=sermon_csv, output_dir=root_dir,
-                          church_name=church_name, default_speaker=default_speaker)
+                          church_name=church_name, default_speaker=default_speaker,
+                          max_workers=max_workers)
 
 
 # Example usage